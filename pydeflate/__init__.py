@@ -1,33 +1,62 @@
 __author__ = """Jorge Rivera"""
 __version__ = "2.1.0"
 
-from pydeflate.deflate.deflators import (
-    oecd_dac_deflate,
-    wb_cpi_deflate,
-    wb_gdp_deflate,
-    wb_gdp_linked_deflate,
-    imf_cpi_deflate,
-    imf_gdp_deflate,
-    imf_cpi_e_deflate,
-)
-
-from pydeflate.deflate.legacy_deflate import deflate
-from pydeflate.exchange.exchangers import (
-    oecd_dac_exchange,
-    wb_exchange,
-    wb_exchange_ppp,
-    imf_exchange,
-)
-from pydeflate.pydeflate_config import setup_logger
+import importlib
+import os
+import types
+
+# Public names and the modules they live in. They are imported on first access
+# so that `import pydeflate` does not pull in pandas and the data readers.
+# Keep in sync with `__init__.pyi`, which exposes the same names to type checkers.
+_LAZY: dict[str, tuple[str, str]] = {
+    "oecd_dac_deflate": ("pydeflate.deflate.deflators", "oecd_dac_deflate"),
+    "wb_cpi_deflate": ("pydeflate.deflate.deflators", "wb_cpi_deflate"),
+    "wb_gdp_deflate": ("pydeflate.deflate.deflators", "wb_gdp_deflate"),
+    "wb_gdp_linked_deflate": ("pydeflate.deflate.deflators", "wb_gdp_linked_deflate"),
+    "imf_cpi_deflate": ("pydeflate.deflate.deflators", "imf_cpi_deflate"),
+    "imf_gdp_deflate": ("pydeflate.deflate.deflators", "imf_gdp_deflate"),
+    "imf_cpi_e_deflate": ("pydeflate.deflate.deflators", "imf_cpi_e_deflate"),
+    "deflate": ("pydeflate.deflate.legacy_deflate", "deflate"),
+    "oecd_dac_exchange": ("pydeflate.exchange.exchangers", "oecd_dac_exchange"),
+    "wb_exchange": ("pydeflate.exchange.exchangers", "wb_exchange"),
+    "wb_exchange_ppp": ("pydeflate.exchange.exchangers", "wb_exchange_ppp"),
+    "imf_exchange": ("pydeflate.exchange.exchangers", "imf_exchange"),
+    "setup_logger": ("pydeflate.pydeflate_config", "setup_logger"),
+}
+
+
+def __getattr__(name: str):
+    """Resolve public names lazily (PEP 562)."""
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module), attr)
+
+    # Importing a subpackage binds it here under its own name, and
+    # `pydeflate.deflate` is also the legacy `deflate` function. Unbind
+    # subpackages that shadow a public name, so that it resolves here instead.
+    for shadowed in [
+        n for n in _LAZY if isinstance(globals().get(n), types.ModuleType)
+    ]:
+        del globals()[shadowed]
+
+    # Cache the resolved object so later lookups skip __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
 
 
 def set_pydeflate_path(path):
+    """Set the path to the data folder."""
     from pathlib import Path
     from pydeflate.pydeflate_config import PYDEFLATE_PATHS
 
-    """Set the path to the data folder."""
-    global PYDEFLATE_PATHS
-
     PYDEFLATE_PATHS.data = Path(path).resolve()
 
 
@@ -45,3 +74,8 @@ __all__ = [
     "imf_exchange",
     "deflate",
 ]
+
+# Resolve everything up front when requested (e.g. in CI, to surface import errors)
+if os.environ.get("EAGER_IMPORT"):
+    for _name in _LAZY:
+        __getattr__(_name)
@@ -0,0 +1,23 @@
+from pydeflate.deflate.deflators import (
+    imf_cpi_deflate as imf_cpi_deflate,
+    imf_cpi_e_deflate as imf_cpi_e_deflate,
+    imf_gdp_deflate as imf_gdp_deflate,
+    oecd_dac_deflate as oecd_dac_deflate,
+    wb_cpi_deflate as wb_cpi_deflate,
+    wb_gdp_deflate as wb_gdp_deflate,
+    wb_gdp_linked_deflate as wb_gdp_linked_deflate,
+)
+from pydeflate.deflate.legacy_deflate import deflate as deflate
+from pydeflate.exchange.exchangers import (
+    imf_exchange as imf_exchange,
+    oecd_dac_exchange as oecd_dac_exchange,
+    wb_exchange as wb_exchange,
+    wb_exchange_ppp as wb_exchange_ppp,
+)
+from pydeflate.pydeflate_config import setup_logger as setup_logger
+
+__author__: str
+__version__: str
+__all__: list[str]
+
+def set_pydeflate_path(path) -> None: ...
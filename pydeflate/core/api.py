@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from pydeflate.core.deflator import ExchangeDeflator, PriceDeflator
@@ -5,26 +6,44 @@ from pydeflate.core.exchange import Exchange
 from pydeflate.core.source import Source
 from pydeflate.sources.common import AvailableDeflators
 from pydeflate.utils import (
+    CACHE_SIZE,
+    build_lookup,
     create_pydeflate_year,
     merge_user_and_pydeflate_data,
     get_unmatched_pydeflate_data,
     get_matched_pydeflate_data,
     flag_missing_pydeflate_data,
+    store_in_cache,
 )
 
 
-def resolve_common_currencies(currency: str, source: str) -> str:
-    mapping = {
-        "USD": "USA",
-        "EUR": "EMU",
-        "GBP": "GBR",
-        "JPY": "JPN",
-        "CAD": "CAN",
-    }
+# Common currency codes and the entity codes used for them in the data sources
+_COMMON_CURRENCIES: dict[str, str] = {
+    "USD": "USA",
+    "EUR": "EMU",
+    "GBP": "GBR",
+    "JPY": "JPN",
+    "CAD": "CAN",
+}
+
+# The DAC data reports the Euro through the EU Institutions
+_COMMON_CURRENCIES_DAC: dict[str, str] = _COMMON_CURRENCIES | {"EUR": "EUI"}
+
+
+# Combined deflator tables built by BaseDeflate, keyed on everything that
+# determines their content. Cached tables are shared and must not be mutated.
+_PYDEFLATE_DATA_CACHE: dict[tuple, pd.DataFrame] = {}
+_PYDEFLATE_DATA_CACHE_SIZE: int = CACHE_SIZE
+
+# Column holding the factor applied by `_base_operation` (keyed on `exchange`)
+_OPERATION_COLUMN: dict[bool, str] = {
+    True: "pydeflate_EXCHANGE",
+    False: "pydeflate_deflator",
+}
 
-    if source == "DAC":
-        mapping["EUR"] = "EUI"
 
+def resolve_common_currencies(currency: str, source: str) -> str:
+    mapping = _COMMON_CURRENCIES_DAC if source == "DAC" else _COMMON_CURRENCIES
     return mapping.get(currency, currency)
 
 
@@ -33,8 +52,8 @@ def _base_operation(
     data: pd.DataFrame,
     entity_column: str,
     year_column: str,
-    value_column: str,
-    target_value_column: str | None = None,
+    value_column: str | list[str],
+    target_value_column: str | list[str] | None = None,
     year_format: str | None = None,
     exchange: bool = False,
     reversed_: bool = False,
@@ -46,8 +65,9 @@ def _base_operation(
         data (pd.DataFrame): Data to be adjusted.
         entity_column (str): Column with entity or country identifiers.
         year_column (str): Column with year information.
-        value_column (str): Column with values to be adjusted.
-        target_value_column (str | None, optional): Column to store adjusted values. Defaults to `value_column`.
+        value_column (str | list[str]): Column(s) with values to be adjusted.
+        target_value_column (str | list[str] | None, optional): Column(s) to store
+        adjusted values, matching `value_column`. Defaults to `value_column`.
         year_format (str, optional): Format of the year. Defaults to "%Y".
         exchange (bool, optional): Whether to perform an exchange rate adjustment (True)
         or deflation (False).
@@ -56,16 +76,29 @@ def _base_operation(
     Returns:
         pd.DataFrame: DataFrame with adjusted values and original columns preserved.
     """
-    # Make a copy of the input data to avoid modifying the original data
-    data = data.copy(deep=True)
+    value_columns = [value_column] if isinstance(value_column, str) else value_column
+
+    if not target_value_column:
+        target_value_columns = value_columns
+    elif isinstance(target_value_column, str):
+        target_value_columns = [target_value_column]
+    else:
+        target_value_columns = target_value_column
+
+    if len(target_value_columns) != len(value_columns):
+        raise ValueError(
+            "`target_value_column` must have one column per `value_column`."
+        )
 
-    target_value_column = target_value_column or value_column
+    # Without a target name, values are stored back in their own column
+    target_value_columns = [
+        target or value for target, value in zip(target_value_columns, value_columns)
+    ]
 
     # Keep track of original columns to return data in the same order.
     cols = (
-        [*data.columns, target_value_column]
-        if target_value_column not in data.columns
-        else data.columns
+        *data.columns,
+        *dict.fromkeys(c for c in target_value_columns if c not in data.columns),
     )
 
     # Merge pydeflate data to the input data
@@ -80,18 +113,29 @@ def _base_operation(
     flag_missing_pydeflate_data(
         base_obj._unmatched_data, entity_column=entity_column, year_column=year_column
     )
-    x = base_obj._merged_data[value_column]
-    y = base_obj._merged_data[
-        "pydeflate_EXCHANGE" if exchange else "pydeflate_deflator"
+
+    # Read all the values before writing any results, as targets may be inputs too
+    xs = [
+        base_obj._merged_data[c].to_numpy(dtype="float64", na_value=np.nan)
+        for c in value_columns
     ]
+    y = base_obj._merged_data[_OPERATION_COLUMN[exchange]].to_numpy(
+        dtype="float64", na_value=np.nan
+    )
 
-    # Apply the correct operation based on `exchange` and `reversed`
-    if (exchange and not reversed_) or (not exchange and reversed_):
-        base_obj._merged_data[target_value_column] = (x * y).round(6)
-    else:
-        base_obj._merged_data[target_value_column] = (x / y).round(6)
+    # Exchanging multiplies and deflating divides, unless reversed
+    operation = np.multiply if exchange ^ reversed_ else np.divide
 
-    return base_obj._merged_data[cols]
+    # Dividing by a zero factor gives a missing value rather than infinity
+    valid = y != 0 if operation is np.divide else True
+
+    for x, target in zip(xs, target_value_columns):
+        out = np.full_like(x, np.nan)
+        operation(x, y, out=out, where=valid)
+        np.round(out, 6, out=out)
+        base_obj._merged_data[target] = pd.array(out, dtype="float64[pyarrow]")
+
+    return base_obj._merged_data.reindex(columns=cols)
 
 
 class BaseExchange:
@@ -102,6 +146,16 @@ class BaseExchange:
     within a dataset.
     """
 
+    __slots__ = (
+        "exchange_rates",
+        "_idx",
+        "pydeflate_data",
+        "_lookup_data",
+        "_lookup_keys",
+        "_unmatched_data",
+        "_merged_data",
+    )
+
     def __init__(
         self,
         exchange_source: Source,
@@ -143,11 +197,15 @@ class BaseExchange:
 
     def _load_pydeflate_data(self) -> None:
         """Load and prepare pydeflate exchange rate data."""
-        self.pydeflate_data = (
-            self.exchange_rates.exchange_data.set_index(self._idx)
-            .dropna(how="any")
-            .reset_index()
-        )
+        # Only the merge keys and the exchange rate itself need to be present.
+        # Sorted by year and entity once, like the combined deflator data.
+        self.pydeflate_data = self.exchange_rates.exchange_data.dropna(
+            subset=self._idx + ["pydeflate_EXCHANGE"]
+        ).sort_values(self._idx, kind="stable", ignore_index=True)
+
+        # Only the keys and the exchange rate are needed to exchange user data
+        self._lookup_data = self.pydeflate_data[[*self._idx, "pydeflate_EXCHANGE"]]
+        self._lookup_keys = build_lookup(self._lookup_data, self._idx)
 
     def _merge_pydeflate_data(
         self,
@@ -173,9 +231,10 @@ class BaseExchange:
         # Merge data to the input data based on year and entity
         merged_data = merge_user_and_pydeflate_data(
             data=data,
-            pydeflate_data=self.pydeflate_data,
+            pydeflate_data=self._lookup_data,
             entity_column=entity_column,
             ix=self._idx,
+            lookup=self._lookup_keys,
         )
 
         # store unmatched data
@@ -229,6 +288,21 @@ class BaseDeflate:
     economic comparisons over time.
     """
 
+    __slots__ = (
+        "exchange_rates",
+        "exchange_deflator",
+        "price_deflator",
+        "_idx",
+        "use_source_codes",
+        "to_current",
+        "_cache_key",
+        "_pydeflate_data",
+        "_lookup_data",
+        "_lookup_keys",
+        "_unmatched_data",
+        "_merged_data",
+    )
+
     def __init__(
         self,
         deflator_source: Source,
@@ -283,28 +357,84 @@ class BaseDeflate:
         self.use_source_codes = use_source_codes
         self.to_current = to_current
 
-        self.__post_init__()
+        # Keyed on the version of both sources' data, so refreshed data (from
+        # any caller) is combined again
+        self._cache_key = (
+            deflator_source.data_key,
+            exchange_source.data_key,
+            base_year,
+            price_kind,
+            source_currency,
+            target_currency,
+            use_source_codes,
+            to_current,
+        )
+
+        # The combined deflator is only built when it is first needed
+        self._pydeflate_data = None
+        self._lookup_data = None
+
+    @property
+    def pydeflate_data(self) -> pd.DataFrame:
+        """The combined deflator data, built on first access."""
+        if self._pydeflate_data is None:
+            self._build()
+        return self._pydeflate_data
+
+    def _build(self) -> None:
+        """Merge deflator, exchange, and pydeflate data into the combined deflator."""
+
+        # Reuse the combined deflator if an identical one was already built
+        data = _PYDEFLATE_DATA_CACHE.get(self._cache_key)
 
-    def __post_init__(self):
-        """Post-initialization process to merge deflator, exchange, and pydeflate data."""
+        if data is None:
+            data = self._combine_components()
 
-        # Merge deflator and exchange rate data
+            # Store the combined deflator for later instances
+            store_in_cache(
+                _PYDEFLATE_DATA_CACHE,
+                self._cache_key,
+                data,
+                max_size=_PYDEFLATE_DATA_CACHE_SIZE,
+            )
+
+        self._pydeflate_data = data
+
+        # Only the keys and the deflator are needed to deflate user data
+        self._lookup_data = data[[*self._idx, "pydeflate_deflator"]].dropna(
+            subset=self._idx, ignore_index=True
+        )
+        self._lookup_keys = build_lookup(self._lookup_data, self._idx)
+
+    def _combine_components(self) -> pd.DataFrame:
+        """Combine the price deflator, exchange deflator and exchange rates into
+        a single table, with the resulting deflator in `pydeflate_deflator`."""
+
+        # Merge deflator and exchange rate data, indexed by year and entity
         data = self._merge_components(
-            df=self.price_deflator.deflator_data,
-            other=self.exchange_deflator.deflator_data,
-        ).pipe(self._merge_components, other=self.exchange_rates.exchange_data)
+            df=self.price_deflator.deflator_data.set_index(self._idx),
+            other=self.exchange_deflator.deflator_data.set_index(self._idx),
+        ).pipe(
+            self._merge_components,
+            other=self.exchange_rates.exchange_data.set_index(self._idx),
+        )
+
+        components = [
+            f"pydeflate_{self.price_deflator.price_kind}",
+            "pydeflate_EXCHANGE_D",
+            "pydeflate_EXCHANGE",
+        ]
 
         # drop where necessary data is missing
-        data = data.set_index(self._idx).dropna(how="any").reset_index()
+        data = data.dropna(subset=components, how="any")
 
         # Calculate price-exchange deflator
         data["pydeflate_deflator"] = self._calculate_deflator_value(
-            data[f"pydeflate_{self.price_deflator.price_kind}"],
-            data["pydeflate_EXCHANGE_D"],
-            data[f"pydeflate_EXCHANGE"],
+            *(data[c] for c in components)
         )
 
-        self.pydeflate_data = data
+        # Only flatten the index once all the merges are done
+        return data.reset_index()
 
     def _calculate_deflator_value(
         self, price_def: pd.Series, exchange_def: pd.Series, exchange_rate: pd.Series
@@ -319,24 +449,45 @@ class BaseDeflate:
         Returns:
             pd.Series: Series with combined deflator values.
         """
-        return (
-            (exchange_def * exchange_rate) / price_def
-            if self.to_current
-            else price_def / (exchange_def * exchange_rate)
+        # Work on plain float64 arrays rather than through pyarrow kernels
+        price, exchange_def, exchange_rate = (
+            s.to_numpy(dtype="float64", na_value=np.nan)
+            for s in (price_def, exchange_def, exchange_rate)
+        )
+
+        # Compute into a single buffer to avoid intermediate aligned Series
+        combined = np.multiply(exchange_def, exchange_rate)
+
+        if self.to_current:
+            np.divide(combined, price, out=combined)
+        else:
+            np.divide(price, combined, out=combined)
+
+        return pd.Series(
+            pd.array(combined, dtype="float64[pyarrow]"), index=price_def.index
         )
 
     def _merge_components(self, df: pd.DataFrame, other: pd.DataFrame):
         """Combine data components, merging deflator and exchange rate information.
 
+        Both frames must be indexed by `self._idx`.
+
         Args:
             df (pd.DataFrame): Main DataFrame for merging.
             other (pd.DataFrame): Additional data to merge into `df`.
 
         Returns:
-            pd.DataFrame: Merged DataFrame without duplicate columns.
+            pd.DataFrame: Merged DataFrame (indexed by `self._idx`) without
+            duplicate columns.
         """
-        merged = df.merge(other, how="outer", on=self._idx, suffixes=("", "_ex"))
-        return merged.drop(columns=merged.filter(regex=f"_ex$").columns, axis=1)
+        # Only bring in the columns that `df` doesn't already have
+        other = other[[c for c in other.columns if c not in df.columns]]
+
+        # Aligning on unique indexes is cheaper than a merge
+        if df.index.is_unique and other.index.is_unique:
+            return pd.concat([df, other], axis=1, join="outer", sort=True)
+
+        return df.merge(other, how="outer", left_index=True, right_index=True)
 
     def _merge_pydeflate_data(
         self,
@@ -359,12 +510,16 @@ class BaseDeflate:
             data=data, year_column=year_column, year_format=year_format
         )
 
+        if self._lookup_data is None:
+            self._build()
+
         # Merge data to the input data based on year and entity
         merged_data = merge_user_and_pydeflate_data(
             data=data,
-            pydeflate_data=self.pydeflate_data,
+            pydeflate_data=self._lookup_data,
             entity_column=entity_column,
             ix=self._idx,
+            lookup=self._lookup_keys,
         )
 
         # store unmatched data
@@ -404,3 +559,47 @@ class BaseDeflate:
             target_value_column=target_value_column,
             year_format=year_format,
         )
+
+    def deflate_many(
+        self,
+        data: pd.DataFrame,
+        entity_column: str,
+        year_column: str,
+        value_columns: list[str],
+        target_value_columns: list[str] | None = None,
+        year_format: str | None = None,
+    ):
+        """Apply deflation adjustment to several value columns of the input data.
+
+        The pydeflate data is merged to the input once, and then all the value
+        columns are deflated, instead of merging once per column. All values are
+        read before any target column is written, so a target may also be one of
+        the value columns.
+
+        Args:
+            data (pd.DataFrame): Data for deflation adjustment.
+            entity_column (str): Column with entity identifiers.
+            year_column (str): Column with year information.
+            value_columns (list[str]): Columns with values to deflate.
+            target_value_columns (list[str] | None, optional): Columns to store deflated
+            values, one per value column. Defaults to `value_columns`.
+            year_format (str, optional): Format of the year. Defaults to "%Y".
+
+        Returns:
+            pd.DataFrame: DataFrame with deflated values.
+        """
+        # Nothing to deflate, so the data is returned as it is
+        if len(value_columns) == 0:
+            return data.copy(deep=False)
+
+        return _base_operation(
+            base_obj=self,
+            data=data,
+            entity_column=entity_column,
+            year_column=year_column,
+            value_column=list(value_columns),
+            target_value_column=(
+                None if target_value_columns is None else list(target_value_columns)
+            ),
+            year_format=year_format,
+        )
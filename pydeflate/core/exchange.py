@@ -1,9 +1,29 @@
 from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
 
 from pydeflate.core.source import Source
 from pydeflate.sources.common import compute_exchange_deflator
+from pydeflate.utils import (
+    CACHE_SIZE,
+    build_lookup,
+    encode_keys,
+    store_in_cache,
+    to_year,
+)
+
+
+# Exchange rate tables built by Exchange, keyed on the version of the source data
+# they come from and the currency pair. Cached tables are shared and must not be
+# mutated.
+_EXCHANGE_DATA_CACHE: dict[tuple, pd.DataFrame] = {}
+_EXCHANGE_DATA_CACHE_SIZE: int = CACHE_SIZE
+
+
+def _drop_pydeflate_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """Keep only the columns whose name doesn't start with 'pydeflate_'."""
+    return data.loc[:, [not str(c).startswith("pydeflate_") for c in data.columns]]
 
 
 @dataclass
@@ -24,20 +44,43 @@ class Exchange:
     source_currency: str = "LCU"
     target_currency: str = "USA"
     exchange_data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    _lookups: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Initialize the Exchange object and process the exchange rate data."""
+        # Keyed on the source's data version, so refreshed data is converted again
+        cache_key = (
+            self.source.data_key,
+            self.source_currency,
+            self.target_currency,
+        )
+
+        # Reuse the converted exchange rates if the same conversion was already done
+        cached = _EXCHANGE_DATA_CACHE.get(cache_key)
+        if cached is not None:
+            self.exchange_data = cached
+            return
+
         # Load and filter the relevant columns from the exchange rate data
         self.exchange_data = self.source.lcu_usd_exchange()
 
         if self.source_currency == self.target_currency:
-            self.exchange_data = self.exchange_rate("LCU", self.target_currency)
-            self.exchange_data["pydeflate_EXCHANGE"] = 1
+            self.exchange_data = self.exchange_rate("LCU", self.target_currency).assign(
+                pydeflate_EXCHANGE=1
+            )
         else:
             self.exchange_data = self.exchange_rate(
                 self.source_currency, self.target_currency
             )
 
+        # Store the converted exchange rates for later conversions
+        store_in_cache(
+            _EXCHANGE_DATA_CACHE,
+            cache_key,
+            self.exchange_data,
+            max_size=_EXCHANGE_DATA_CACHE_SIZE,
+        )
+
     def _get_exchange_rate(self, currency):
         """Helper function to fetch exchange rates for a given currency."""
         exchange_rate = self.exchange_data.loc[
@@ -45,43 +88,49 @@ class Exchange:
         ]
         return exchange_rate
 
-    def _convert_exchange(self, to_: str) -> pd.DataFrame:
+    def _convert_exchange(self, to_: str) -> pd.Series:
         """Converts exchange rates based on the target currency.
 
-        This method retrieves exchange rates for a given target currency, merges the
-        target exchange rates with the base exchange rates, and computes the final
-        exchange rate by dividing the base exchange rate by the target exchange rate.
+        This method retrieves exchange rates for a given target currency, maps the
+        target exchange rate of each year onto the base exchange rates, and computes
+        the final exchange rate by dividing the base exchange rate by the target
+        exchange rate.
 
         Args:
             to_ (str): The target currency code.
 
         Returns:
-            pd.DataFrame: A DataFrame with the adjusted exchange rates for the target currency.
+            pd.Series: The adjusted exchange rates for the target currency, aligned
+            with the rows of `exchange_data`.
 
         Raises:
             ValueError: If no exchange rate data is available for the target currency.
         """
 
         if to_ == "LCU":
-            return self.exchange_data.copy().assign(pydeflate_EXCHANGE=1)
+            return pd.Series(
+                1, index=self.exchange_data.index, name="pydeflate_EXCHANGE"
+            )
 
-        usd_rate = self.exchange_data.copy()
         target_exchange = self._get_exchange_rate(to_)
 
         if target_exchange.empty:
             raise ValueError(f"No currency exchange data for {to_=}")
 
-        merged = pd.merge(
-            usd_rate,
-            target_exchange,
-            how="left",
-            on=["pydeflate_year"],
-            suffixes=("", "_to"),
-        ).assign(
-            pydeflate_EXCHANGE=lambda d: d.pydeflate_EXCHANGE / d.pydeflate_EXCHANGE_to,
+        # Look up the target rate by year. More than one entity can map to the
+        # target currency (e.g. fuzzy matched names), so keep the first available
+        # rate per year, in entity code order.
+        target_rate = (
+            target_exchange.dropna(subset="pydeflate_EXCHANGE")
+            .sort_values("pydeflate_entity_code", kind="stable")
+            .drop_duplicates("pydeflate_year")
+            .set_index("pydeflate_year")["pydeflate_EXCHANGE"]
         )
 
-        return merged.drop(columns=merged.filter(regex="_to$").columns, axis=1)
+        # Only the rate column is needed, so don't copy the rest of the table
+        return self.exchange_data["pydeflate_EXCHANGE"] / self.exchange_data[
+            "pydeflate_year"
+        ].map(target_rate)
 
     def exchange_rate(self, from_currency: str, to_currency: str):
         """Calculates the exchange rates between the source and target currencies.
@@ -91,23 +140,22 @@ class Exchange:
             to_currency (str): The target currency code.
 
         Returns:
-            None
+            pd.DataFrame: The exchange rates and exchange rate deflators.
         """
-        # Get exchange data based on the source currency.
-        source = self._convert_exchange(to_=from_currency)
-
-        # Get exchange data based on the target currency.
+        # Get exchange rates based on the target currency.
         target = self._convert_exchange(to_=to_currency)
 
-        # Merge the source and target exchange data and compute the final exchange rate.
-        merged = pd.merge(
-            source,
-            target,
-            how="left",
-            on=["pydeflate_year", "pydeflate_entity_code", "pydeflate_iso3"],
-            suffixes=("", "_to"),
-        ).assign(
-            pydeflate_EXCHANGE=lambda d: d.pydeflate_EXCHANGE / d.pydeflate_EXCHANGE_to
+        # Get exchange rates based on the source currency. Local currency rates
+        # are all 1, so there is nothing to convert.
+        if from_currency == "LCU":
+            source = 1
+        else:
+            source = self._convert_exchange(to_=from_currency)
+
+        # Both conversions keep the rows of the exchange data, so they line up
+        # without a merge. Compute the final exchange rate.
+        merged = self.exchange_data.assign(
+            pydeflate_EXCHANGE=source / target, pydeflate_EXCHANGE_to=target
         )
 
         # Compute the exchange rate deflator
@@ -119,10 +167,51 @@ class Exchange:
         )
 
         # Drop unnecessary columns
-        merged = merged.drop(columns=merged.filter(regex="_to$").columns, axis=1)
+        merged = merged.drop(columns=[c for c in merged.columns if c.endswith("_to")])
 
         return merged
 
+    def _lookup(self, key: str) -> tuple[pd.DataFrame, tuple]:
+        """The exchange data with complete keys, and its `build_lookup` index, for
+        looking up rows by year and `key`. Built once per key."""
+        if key not in self._lookups:
+            data = self.exchange_data.dropna(
+                subset=["pydeflate_year", key], ignore_index=True
+            )
+            lookup = build_lookup(data, ["pydeflate_year", key])
+
+            if not lookup[2].is_unique:
+                raise ValueError(
+                    f"Exchange data is not unique by pydeflate_year and {key}."
+                )
+
+            self._lookups[key] = data, lookup
+
+        return self._lookups[key]
+
+    def _merge_exchange_data(
+        self,
+        data: pd.DataFrame,
+        column: str,
+        entity_column: str,
+        use_source_codes: bool = False,
+    ) -> pd.DataFrame:
+        """Add one column of the exchange data to the input data, by year and entity.
+
+        The exchange data is keyed uniquely by year and entity, so each input row
+        matches at most one row, which is looked up rather than merged.
+        """
+        key = "pydeflate_entity_code" if use_source_codes else "pydeflate_iso3"
+        exchange_data, lookup = self._lookup(key)
+
+        position = lookup[2].get_indexer(
+            encode_keys(data["pydeflate_year"], data[entity_column], lookup)
+        )
+
+        return data.reset_index(drop=True).assign(
+            **{column: exchange_data[column].array.take(position, allow_fill=True)}
+        )
+
     def exchange(
         self,
         data: pd.DataFrame,
@@ -145,39 +234,30 @@ class Exchange:
 
         Returns:
             pd.DataFrame: DataFrame with the values converted to the target currency.
+            Rows without exchange data for their year and entity get NaN, also
+            when the source and target currencies are the same.
         """
 
-        # Convert the year to an integer
-        data["pydeflate_year"] = pd.to_datetime(
-            data[year_column], format=year_format
-        ).dt.year
-
-        # exchange columns
-        exchange_cols = [
-            "pydeflate_year",
-            "pydeflate_entity_code",
-            "pydeflate_iso3",
-            "pydeflate_EXCHANGE",
-        ]
+        # Convert the year to an integer (on a new frame, leaving the input untouched)
+        data = data.assign(pydeflate_year=to_year(data[year_column], year_format))
 
         # Merge exchange rate data to the input data based on year and entity
-        merged_data = data.merge(
-            self.exchange_data.filter(exchange_cols),
-            how="left",
-            left_on=["pydeflate_year", entity_column],
-            right_on=[
-                "pydeflate_year",
-                "pydeflate_entity_code" if use_source_codes else "pydeflate_iso3",
-            ],
+        merged_data = self._merge_exchange_data(
+            data,
+            column="pydeflate_EXCHANGE",
+            entity_column=entity_column,
+            use_source_codes=use_source_codes,
         )
 
-        # Apply the exchange rate to convert the value column
-        merged_data[value_column] = (
-            merged_data[value_column] / merged_data["pydeflate_EXCHANGE"]
+        # Apply the exchange rate to convert the value column, on plain float arrays
+        values = merged_data[value_column].to_numpy(dtype="float64", na_value=np.nan)
+        rates = merged_data["pydeflate_EXCHANGE"].to_numpy(
+            dtype="float64", na_value=np.nan
         )
+        merged_data[value_column] = pd.array(values / rates, dtype="float64[pyarrow]")
 
         # Drop all columns that start with pydeflate_ merging and return the result
-        return merged_data.filter(regex="^(?!pydeflate_)")
+        return _drop_pydeflate_columns(merged_data)
 
     def deflator(self) -> pd.DataFrame:
         """Get the exchange rate deflator data.
@@ -217,21 +297,15 @@ class Exchange:
             pd.DataFrame: DataFrame with the deflator data merged to the input data.
 
         """
-
-        # Convert the year to an integer
-        data["pydeflate_year"] = pd.to_datetime(
-            data[year_column], format=year_format
-        ).dt.year
+        # Convert the year to an integer (on a new frame, leaving the input untouched)
+        data = data.assign(pydeflate_year=to_year(data[year_column], year_format))
 
         # Merge exchange rate data to the input data based on year and entity
-        merged_data = data.merge(
-            self.deflator(),
-            how="left",
-            left_on=["pydeflate_year", entity_column],
-            right_on=[
-                "pydeflate_year",
-                "pydeflate_entity_code" if use_source_codes else "pydeflate_iso3",
-            ],
+        merged_data = self._merge_exchange_data(
+            data,
+            column="pydeflate_EXCHANGE_D",
+            entity_column=entity_column,
+            use_source_codes=use_source_codes,
         )
 
-        return merged_data.filter(regex="^(?!pydeflate_)")
+        return _drop_pydeflate_columns(merged_data)
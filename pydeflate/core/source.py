@@ -1,11 +1,39 @@
 from dataclasses import dataclass, field
+from itertools import count
 
 import pandas as pd
 
+from pydeflate.pydeflate_config import PYDEFLATE_PATHS
 from pydeflate.sources.common import AvailableDeflators
 from pydeflate.sources.dac import read_dac
 from pydeflate.sources.imf import read_weo
 from pydeflate.sources.world_bank import read_wb, read_wb_lcu_ppp, read_wb_usd_ppp
+from pydeflate.utils import CACHE_SIZE, store_in_cache
+
+# Data read by Source, keyed on the data folder, the reader and the state of the
+# data files, together with the column selections taken from it. Reading and
+# validating a parquet file is the slowest step of most calls, so it is only done
+# again when the files change. Sources get their own copies of the cached tables.
+_SOURCE_DATA_CACHE: dict[tuple, tuple[pd.DataFrame, dict[str, pd.DataFrame], int]] = {}
+_SOURCE_DATA_CACHE_SIZE: int = CACHE_SIZE
+
+# Numbers each read of source data. Tables derived from the data are cached on
+# `Source.data_key`, which includes this number, so a re-read (e.g. with
+# `update=True`) means they are built again from the new data.
+_DATA_VERSIONS = count()
+
+
+def _data_files_state() -> tuple:
+    """The name and modification time of each parquet file in the data folder,
+    so that files updated by another process are noticed."""
+    state = []
+    for file in PYDEFLATE_PATHS.data.glob("*.parquet"):
+        try:
+            state.append((file.name, file.stat().st_mtime_ns))
+        except OSError:
+            continue
+
+    return tuple(sorted(state))
 
 
 @dataclass
@@ -14,12 +42,47 @@ class Source:
     reader: callable
     update: bool = False
     data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    _cached_data: pd.DataFrame = field(
+        default_factory=pd.DataFrame, init=False, repr=False, compare=False
+    )
+    _views: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _version: int = field(default=-1, init=False, repr=False, compare=False)
     _idx = ["pydeflate_year", "pydeflate_entity_code", "pydeflate_iso3"]
 
     def __post_init__(self):
+        cache_key = (str(PYDEFLATE_PATHS.data), self.name, self.reader)
+
+        # Reuse data read from the same files, unless fresh data is requested
+        cached = _SOURCE_DATA_CACHE.get((*cache_key, _data_files_state()))
+        if not self.update and cached is not None:
+            self._cached_data, self._views, self._version = cached
+            self.data = self._cached_data.copy()
+            return
+
         self.data = self.reader(self.update)
         self.validate()
 
+        # Files written by older versions may hold plain Python strings
+        strings = self.data.select_dtypes(include="object").columns
+        if len(strings) > 0:
+            self.data = self.data.astype({c: "string[pyarrow]" for c in strings})
+
+        # Keyed on the files as they are after reading, which may have updated them
+        self._cached_data, self._version = self.data, next(_DATA_VERSIONS)
+        store_in_cache(
+            _SOURCE_DATA_CACHE,
+            (*cache_key, _data_files_state()),
+            (self._cached_data, self._views, self._version),
+            max_size=_SOURCE_DATA_CACHE_SIZE,
+        )
+        self.data = self._cached_data.copy()
+
+    @property
+    def data_key(self) -> tuple:
+        """Identifies the data held by this source. It changes every time the
+        data is read again, so it can key caches of tables derived from it."""
+        return self.name, self.reader, self._version
+
     def validate(self):
         if self.data.empty:
             raise ValueError(f"No data found for {self.name}")
@@ -28,15 +91,23 @@ class Source:
         if not all(col.startswith("pydeflate_") for col in self.data.columns):
             raise ValueError(f"Invalid data format for {self.name}")
 
+    def _view(self, column: str) -> pd.DataFrame:
+        """The index columns and `column` of the data. Built once per column, and
+        copied so that callers can't change the cached selection."""
+        if column not in self._views:
+            self._views[column] = self._cached_data.filter(self._idx + [column])
+
+        return self._views[column].copy()
+
     def lcu_usd_exchange(self) -> pd.DataFrame:
-        return self.data.filter(self._idx + ["pydeflate_EXCHANGE"])
+        return self._view("pydeflate_EXCHANGE")
 
     def price_deflator(self, kind: AvailableDeflators = "NGDP_D") -> pd.DataFrame:
 
         if f"pydeflate_{kind}" not in self.data.columns:
             raise ValueError(f"No deflator data found for {kind} in {self.name} data.")
 
-        return self.data.filter(self._idx + [f"pydeflate_{kind}"])
+        return self._view(f"pydeflate_{kind}")
 
 
 class IMF(Source):
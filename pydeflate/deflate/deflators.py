@@ -19,8 +19,10 @@ def _generate_docstring(source_name: str, price_kind: str) -> str:
         "    id_column (str, optional): Column with entity identifiers. Defaults to 'iso_code'.\n"
         "    year_column (str, optional): Column with year information. Defaults to 'year'.\n"
         "    use_source_codes (bool, optional): Use source-specific entity codes. Defaults to False.\n"
-        "    value_column (str, optional): Column with values to deflate. Defaults to 'value'.\n"
-        "    target_value_column (str, optional): Column to store deflated values. Defaults to 'value'.\n"
+        "    value_column (str | list[str], optional): Column, or list of columns, with values to deflate. Defaults to 'value'.\n"
+        "    target_value_column (str | list[str], optional): Column to store deflated values. Defaults to 'value'.\n"
+        "        If `value_column` is a list, a list of target columns of the same length, or the\n"
+        "        value columns are deflated in place.\n"
         "    to_current (bool, optional): Adjust values to current-year values if True. Defaults to False.\n"
         "    year_format (str | None, optional): Format of the year in `year_column`. Defaults to None.\n"
         "    update_deflators (bool, optional): Update the deflator data before deflation. Defaults to False.\n\n"
@@ -43,8 +45,8 @@ def _deflator(deflator_source_cls, price_kind):
             id_column: str = "iso_code",
             year_column: str = "year",
             use_source_codes: bool = False,
-            value_column: str = "value",
-            target_value_column: str = "value",
+            value_column: str | list[str] = "value",
+            target_value_column: str | list[str] = "value",
             to_current: bool = False,
             year_format: str | None = None,
             update_deflators: bool = False,
@@ -62,13 +64,17 @@ def _deflator(deflator_source_cls, price_kind):
                 raise ValueError(
                     f"The year_column '{year_column}' is not in the DataFrame."
                 )
-            if value_column not in data.columns:
-                raise ValueError(
-                    f"The value_column '{value_column}' is not in the DataFrame."
-                )
+            value_columns = (
+                [value_column] if isinstance(value_column, str) else value_column
+            )
+            for column in value_columns:
+                if column not in data.columns:
+                    raise ValueError(
+                        f"The value_column '{column}' is not in the DataFrame."
+                    )
 
-            # Copy the data to avoid modifying the original
-            to_deflate = data.copy()
+            # Shallow copy: the data is never modified in place, only new frames are built
+            to_deflate = data.copy(deep=False)
 
             # Initialize the deflator source
             source = deflator_source_cls(update=update_deflators)
@@ -85,6 +91,21 @@ def _deflator(deflator_source_cls, price_kind):
                 to_current=to_current,
             )
 
+            # Deflate several columns at once, in place unless targets are given
+            if not isinstance(value_column, str):
+                return deflator.deflate_many(
+                    data=to_deflate,
+                    entity_column=id_column,
+                    year_column=year_column,
+                    value_columns=value_column,
+                    target_value_columns=(
+                        None
+                        if isinstance(target_value_column, str)
+                        else target_value_column
+                    ),
+                    year_format=year_format,
+                )
+
             # Deflate the data
             return deflator.deflate(
                 data=to_deflate,
@@ -112,8 +133,8 @@ def oecd_dac_deflate(
     id_column: str = "iso_code",
     year_column: str = "year",
     use_source_codes: bool = False,
-    value_column: str = "value",
-    target_value_column: str = "value",
+    value_column: str | list[str] = "value",
+    target_value_column: str | list[str] = "value",
     to_current: bool = False,
     year_format: str | None = None,
     update_deflators: bool = False,
@@ -130,8 +151,8 @@ def wb_gdp_deflate(
     id_column: str = "iso_code",
     year_column: str = "year",
     use_source_codes: bool = False,
-    value_column: str = "value",
-    target_value_column: str = "value",
+    value_column: str | list[str] = "value",
+    target_value_column: str | list[str] = "value",
     to_current: bool = False,
     year_format: str | None = None,
     update_deflators: bool = False,
@@ -148,8 +169,8 @@ def wb_gdp_linked_deflate(
     id_column: str = "iso_code",
     year_column: str = "year",
     use_source_codes: bool = False,
-    value_column: str = "value",
-    target_value_column: str = "value",
+    value_column: str | list[str] = "value",
+    target_value_column: str | list[str] = "value",
     to_current: bool = False,
     year_format: str | None = None,
     update_deflators: bool = False,
@@ -166,8 +187,8 @@ def wb_cpi_deflate(
     id_column: str = "iso_code",
     year_column: str = "year",
     use_source_codes: bool = False,
-    value_column: str = "value",
-    target_value_column: str = "value",
+    value_column: str | list[str] = "value",
+    target_value_column: str | list[str] = "value",
     to_current: bool = False,
     year_format: str | None = None,
     update_deflators: bool = False,
@@ -184,8 +205,8 @@ def imf_gdp_deflate(
     id_column: str = "iso_code",
     year_column: str = "year",
     use_source_codes: bool = False,
-    value_column: str = "value",
-    target_value_column: str = "value",
+    value_column: str | list[str] = "value",
+    target_value_column: str | list[str] = "value",
     to_current: bool = False,
     year_format: str | None = None,
     update_deflators: bool = False,
@@ -202,8 +223,8 @@ def imf_cpi_deflate(
     id_column: str = "iso_code",
     year_column: str = "year",
     use_source_codes: bool = False,
-    value_column: str = "value",
-    target_value_column: str = "value",
+    value_column: str | list[str] = "value",
+    target_value_column: str | list[str] = "value",
     to_current: bool = False,
     year_format: str | None = None,
     update_deflators: bool = False,
@@ -220,8 +241,8 @@ def imf_cpi_e_deflate(
     id_column: str = "iso_code",
     year_column: str = "year",
     use_source_codes: bool = False,
-    value_column: str = "value",
-    target_value_column: str = "value",
+    value_column: str | list[str] = "value",
+    target_value_column: str | list[str] = "value",
     to_current: bool = False,
     year_format: str | None = None,
     update_deflators: bool = False,
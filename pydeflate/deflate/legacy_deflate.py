@@ -6,6 +6,23 @@ from pandas.util._decorators import deprecate_kwarg
 from pydeflate.core.api import BaseDeflate
 from pydeflate.core.source import DAC, WorldBank, IMF
 
+# Legacy deflator method names and the price kinds they map to
+_PRICE_KINDS = {
+    "oecd_dac": "NGDP_D",
+    "dac_deflator": "NGDP_D",
+    "gdp": "NGDP_D",
+    "cpi": "CPI",
+}
+
+# Mapping of legacy source names to source classes
+_SOURCES = {
+    "oecd_dac": DAC,
+    "dac": DAC,
+    "wb": WorldBank,
+    "world_bank": WorldBank,
+    "imf": IMF,
+}
+
 
 @deprecate_kwarg(old_arg_name="method", new_arg_name="deflator_method")
 @deprecate_kwarg(old_arg_name="source", new_arg_name="deflator_source")
@@ -64,28 +81,12 @@ def deflate(
             "You can use bblocks to convert to ISO3."
         )
 
-    price_kind = {
-        "oecd_dac": "NGDP_D",
-        "dac_deflator": "NGDP_D",
-        "gdp": "NGDP_D",
-        "cpi": "CPI",
-    }
-
-    # Mapping of string identifiers to classes and price kinds
-    deflator_source_map = {
-        "oecd_dac": DAC,
-        "dac": DAC,
-        "wb": WorldBank,
-        "world_bank": WorldBank,
-        "imf": IMF,
-    }
-
-    deflator_source = deflator_source_map[deflator_source.lower()]()
-    exchange_source = deflator_source_map[exchange_source.lower()]()
-    deflator_method = price_kind.get(deflator_method.lower(), deflator_method).upper()
+    deflator_source = _SOURCES[deflator_source.lower()]()
+    exchange_source = _SOURCES[exchange_source.lower()]()
+    deflator_method = _PRICE_KINDS.get(deflator_method.lower(), deflator_method).upper()
 
-    # Copy the data to avoid modifying the original
-    to_deflate = df.copy()
+    # Shallow copy: the data is never modified in place, only new frames are built
+    to_deflate = df.copy(deep=False)
 
     # Create a deflator object
     deflator = BaseDeflate(
@@ -1,7 +1,6 @@
 from functools import wraps
 
 import pandas as pd
-from frictionless.console.common import source
 
 from pydeflate.core.api import BaseExchange
 from pydeflate.core.source import DAC, WorldBank, IMF, WorldBankPPP
@@ -72,8 +71,8 @@ def _exchange(exchange_source_cls, **fixed_params):
                     f"The value_column '{value_column}' is not in the DataFrame."
                 )
 
-            # Copy the data to avoid modifying the original
-            to_exchange = data.copy()
+            # Shallow copy: the data is never modified in place, only new frames are built
+            to_exchange = data.copy(deep=False)
 
             # Initialize the deflator source
             if exchange_source_cls.__name__ == "WorldBankPPP":
@@ -5,7 +5,9 @@ from pathlib import Path
 class PYDEFLATE_PATHS:
     """Class to store the paths to the data and output folders."""
 
-    package = Path(__file__).resolve().parent.parent
+    # Not resolved, to avoid filesystem calls at import time. A user-supplied
+    # path is resolved in `set_pydeflate_path`.
+    package = Path(__file__).parent.parent
     data = package / "pydeflate" / ".pydeflate_data"
     settings = package / "pydeflate" / "settings"
     test_data = package / "tests" / "test_files"
@@ -1,7 +1,11 @@
-from datetime import datetime
+import json
+import os
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 from hdx.location.country import Country
 
@@ -9,6 +13,12 @@ from pydeflate.pydeflate_config import PYDEFLATE_PATHS, logger
 
 AvailableDeflators = Literal["NGDP_D", "NGDP_DL", "CPI", "PCPI", "PCPIE"]
 
+# Data files whose age has already been checked in this process
+_FRESHNESS_CHECKED: set[Path] = set()
+
+# How long a freshness check stays valid across processes
+FRESHNESS_TTL_MINUTES: int = 1440
+
 
 def check_file_age(file: Path) -> int:
     """Check the age of a WEO file in days.
@@ -27,9 +37,123 @@ def check_file_age(file: Path) -> int:
     return (current_date - file_date).days
 
 
+def _freshness_cache_file() -> Path:
+    return PYDEFLATE_PATHS.data / ".freshness.json"
+
+
+def _read_freshness_cache() -> dict:
+    """Read the record of previous freshness checks. Returns an empty dict if
+    the record is missing or unreadable."""
+    try:
+        with open(_freshness_cache_file()) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_freshness_cache(cache: dict) -> None:
+    """Persist the record of freshness checks. Failing to write (e.g. a
+    read-only data folder) only means the check runs again next time."""
+    try:
+        with open(_freshness_cache_file(), "w") as file:
+            json.dump(cache, file)
+    except OSError:
+        logger.debug("Could not write the freshness cache file.")
+
+
+def _checked_recently(entry: dict | None) -> bool:
+    """Check whether a freshness cache entry is still within its TTL."""
+    if not entry:
+        return False
+    try:
+        checked_at = datetime.fromisoformat(entry["checked_at"])
+        ttl = timedelta(minutes=entry.get("ttl_minutes", FRESHNESS_TTL_MINUTES))
+    except (KeyError, TypeError, ValueError):
+        return False
+
+    return datetime.now() - checked_at < ttl
+
+
+def warn_if_stale(file: Path, data_name: str, max_age: int = 120) -> None:
+    """Log a warning if a data file is older than `max_age` days.
+
+    The check runs at most once per file and process, and at most once per
+    `FRESHNESS_TTL_MINUTES` across processes (the last check is recorded in
+    `.freshness.json` in the data folder). It is skipped entirely when the
+    `PYDEFLATE_SKIP_FRESHNESS` environment variable is set.
+
+    Args:
+        file (Path): The data file to check.
+        data_name (str): Name of the dataset for logging purposes.
+        max_age (int): Maximum age, in days, before a warning is logged.
+    """
+    if os.environ.get("PYDEFLATE_SKIP_FRESHNESS") or file in _FRESHNESS_CHECKED:
+        return
+
+    _FRESHNESS_CHECKED.add(file)
+
+    cache = _read_freshness_cache()
+    if _checked_recently(cache.get(file.name)):
+        return
+
+    cache[file.name] = {
+        "checked_at": datetime.now().isoformat(),
+        "ttl_minutes": FRESHNESS_TTL_MINUTES,
+    }
+    _write_freshness_cache(cache)
+
+    if check_file_age(file) > max_age:
+        logger.warning(
+            f"The latest {data_name} data is more than {max_age} days old.\n"
+            f"Consider updating by setting update=True in the function call."
+        )
+
+
+def invalidate_freshness(files: list[Path]) -> None:
+    """Forget previous freshness checks for the given data files.
+
+    Called after new data is downloaded, so that the next read checks the
+    current files instead of relying on a record made before the update.
+
+    Args:
+        files (list[Path]): The data files to forget.
+    """
+    _FRESHNESS_CHECKED.difference_update(files)
+
+    cache = _read_freshness_cache()
+    stale = [file.name for file in files if file.name in cache]
+    if not stale:
+        return
+
+    for name in stale:
+        del cache[name]
+    _write_freshness_cache(cache)
+
+
 def enforce_pyarrow_types(df: pd.DataFrame) -> pd.DataFrame:
-    """Ensures that a DataFrame uses pyarrow dtypes."""
-    return df.convert_dtypes(dtype_backend="pyarrow")
+    """Ensures that a DataFrame uses pyarrow dtypes.
+
+    Columns that already use a pyarrow dtype are left as they are, since
+    converting them would not change them.
+    """
+    positions = [
+        i for i, dtype in enumerate(df.dtypes) if not isinstance(dtype, pd.ArrowDtype)
+    ]
+
+    if not positions:
+        return df
+
+    if len(positions) == df.shape[1]:
+        return df.convert_dtypes(dtype_backend="pyarrow")
+
+    converted = df.iloc[:, positions].convert_dtypes(dtype_backend="pyarrow")
+
+    # Replace by position, so that duplicated column names are handled correctly
+    df = df.copy(deep=False)
+    for position, (_, column) in zip(positions, converted.items()):
+        df.isetitem(position, column)
+
+    return df
 
 
 def today() -> str:
@@ -38,6 +162,13 @@ def today() -> str:
     return datetime.today().strftime("%Y-%m-%d")
 
 
+@lru_cache(maxsize=None)
+def _fuzzy_iso3(name: str) -> str | None:
+    """Fuzzy match a country name to its ISO3 code. Matching is slow and source
+    files repeat the same names, so each name is only matched once."""
+    return Country().get_iso3_country_code_fuzzy(name)[0]
+
+
 def _match_regex_to_iso3(
     to_match: list[str], additional_mapping: dict | None
 ) -> dict[str, str]:
@@ -52,16 +183,16 @@ def _match_regex_to_iso3(
     if additional_mapping is None:
         additional_mapping = {}
 
-    # Create a Country object
-    country = Country()
-
-    # Match the regex strings to ISO3 country codes
+    # Match the regex strings to ISO3 country codes. Strings in the additional
+    # mapping don't need matching, since the mapping takes precedence.
     matches = {}
 
     for match in to_match:
-        match_ = country.get_iso3_country_code_fuzzy(match)[0]
+        if match in additional_mapping:
+            continue
+        match_ = _fuzzy_iso3(match)
         matches[match] = match_
-        if match_ is None and match not in additional_mapping:
+        if match_ is None:
             logger.debug(f"No ISO3 match found for {match}")
 
     return matches | additional_mapping
@@ -178,6 +309,19 @@ def identify_base_year(df: pd.DataFrame, measure: str, year: str = "year") -> in
     return base_year.iloc[0] if not base_year.empty else None
 
 
+def _first_by_group(
+    values: np.ndarray, mask: np.ndarray, group: np.ndarray, n_groups: int
+) -> np.ndarray:
+    """The first of `values` where `mask` is True in each group, or NaN if there
+    is none. `group` holds the group number (0 to `n_groups - 1`) of each row."""
+    result = np.full(n_groups, np.nan)
+    position = np.flatnonzero(mask)
+    groups, first = np.unique(group[position], return_index=True)
+    result[groups] = values[position[first]]
+
+    return result
+
+
 def compute_exchange_deflator(
     df: pd.DataFrame,
     base_year_measure: str | None = None,
@@ -199,49 +343,56 @@ def compute_exchange_deflator(
 
     Returns:
         pd.DataFrame: DataFrame with an additional column for the exchange rate deflator.
+        Rows keep the order and index of `df`, except rows with a missing grouper
+        value, which are dropped.
     """
 
-    def _add_deflator(
-        group: pd.DataFrame,
-        measure: str | None = "NGDPD_D",
-        exchange: str = "EXCHANGE",
-        year: str = "year",
-    ) -> pd.DataFrame:
+    if grouper is None:
+        grouper = ["entity", "entity_code"]
 
-        # if needed, clean exchange name
-        if exchange.endswith("_to") or exchange.endswith("_from"):
-            exchange_name = exchange.rsplit("_", 1)[0]
-        else:
-            exchange_name = exchange
+    # if needed, clean exchange name
+    if exchange.endswith("_to") or exchange.endswith("_from"):
+        exchange_name = exchange.rsplit("_", 1)[0]
+    else:
+        exchange_name = exchange
 
-        # Identify the base year for the deflator
-        if measure is not None:
-            base_year = identify_base_year(group, measure=measure, year=year)
-        else:
-            base_year = group.dropna(subset=exchange)[year].max()
+    # Number the groups. Rows with a missing group key belong to no group and
+    # are dropped.
+    group = df.groupby(grouper).ngroup().fillna(-1).to_numpy(dtype="int64")
+    df, group = df.loc[group >= 0], group[group >= 0]
+    n_groups = group.max() + 1 if len(group) else 0
 
-        # If no base year is found, return the group unchanged
-        if base_year is None or pd.isna(base_year):
-            return group
+    years = df[year].to_numpy(dtype="float64", na_value=np.nan)
+    rates = df[exchange].to_numpy(dtype="float64", na_value=np.nan)
 
-        # Extract the exchange rate value for the base year
-        base_value = group.loc[group[year] == base_year, exchange].values
+    # Identify the base year for each group
+    if base_year_measure is not None:
+        is_base = df[base_year_measure].round(2) == 100
+        base_year = _first_by_group(
+            years, is_base.fillna(False).to_numpy(dtype=bool), group, n_groups
+        )
+    else:
+        base_year = np.full(n_groups, np.nan)
+        np.fmax.at(base_year, group, np.where(np.isnan(rates), np.nan, years))
 
-        # If base value is found and valid, calculate the deflator
-        if base_value.size > 0 and pd.notna(base_value[0]):
-            group[f"{exchange_name}_D"] = round(
-                100 * group[exchange] / base_value[0], 6
-            )
+    # Extract the exchange rate value for the base year
+    base_value = _first_by_group(rates, years == base_year[group], group, n_groups)
+    base_value = base_value[group]
 
-        return group
+    # Groups without a valid base value are left unchanged
+    has_base = ~np.isnan(base_value)
+    if not has_base.any():
+        return df
 
-    if grouper is None:
-        grouper = ["entity", "entity_code"]
+    column = f"{exchange_name}_D"
+    deflator = (100 * df[exchange] / base_value).round(6)
 
-    # Apply the deflator computation for each group of 'entity' and 'entity_code'
-    return df.groupby(grouper, group_keys=False).apply(
-        _add_deflator, measure=base_year_measure, exchange=exchange, year=year
-    )
+    if column in df.columns:
+        deflator = deflator.where(has_base, df[column])
+    else:
+        deflator = deflator.where(has_base)
+
+    return df.assign(**{column: deflator})
 
 
 def read_data(
@@ -269,6 +420,7 @@ def read_data(
     if len(files) == 0 or update:
         download_func()
         files = file_finder_func(PYDEFLATE_PATHS.data)
+        invalidate_freshness(files)
 
     # If files are found, sort them by age and load the most recent one
     if len(files) > 0:
@@ -276,11 +428,7 @@ def read_data(
         latest_file = files[0]
 
         # Check if the latest file is older than 120 days and log a warning
-        if check_file_age(latest_file) > 120:
-            logger.warn(
-                f"The latest {data_name} data is more than 120 days old.\n"
-                f"Consider updating by setting update=True in the function call."
-            )
+        warn_if_stale(latest_file, data_name=data_name)
 
         # Read and return the latest parquet file as a DataFrame
         logger.info(f"Reading {data_name} data from {latest_file}")
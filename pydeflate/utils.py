@@ -1,4 +1,6 @@
 import json
+from functools import cache
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
@@ -7,18 +9,37 @@ from pydeflate.pydeflate_config import PYDEFLATE_PATHS, logger
 from pydeflate.sources.common import enforce_pyarrow_types
 
 
+@cache
+def _read_settings_file(path: Path):
+    """Read a JSON settings file. Settings ship with the package, so each file
+    is only read once."""
+    with open(path) as file:
+        return json.load(file)
+
+
+# Number of tables kept by each of the in-memory caches of derived data
+CACHE_SIZE: int = 32
+
+
+def store_in_cache(cache: dict, key, value, max_size: int = CACHE_SIZE) -> None:
+    """Store `value` in `cache` under `key`, evicting the oldest entries first so
+    that the cache never holds more than `max_size` of them."""
+    cache.pop(key, None)
+    while cache and len(cache) >= max_size:
+        cache.pop(next(iter(cache)))
+
+    cache[key] = value
+
+
 def oecd_codes() -> dict:
-    with open(PYDEFLATE_PATHS.settings / "oecd_codes.json") as file:
-        updates = json.load(file)
+    updates = _read_settings_file(PYDEFLATE_PATHS.settings / "oecd_codes.json")
 
     return {int(k): v for k, v in updates.items()}
 
 
 def emu() -> list:
-    with open(PYDEFLATE_PATHS.settings / "emu.json") as file:
-        emu = json.load(file)
-
-    return emu
+    # Return a copy, so that callers can't change the cached settings
+    return list(_read_settings_file(PYDEFLATE_PATHS.settings / "emu.json"))
 
 
 def clean_number(number):
@@ -36,19 +57,108 @@ def clean_number(number):
     return float(number)
 
 
+def to_year(series: pd.Series, year_format: str) -> pd.Series:
+    """Extract the year from a column of dates or date-like values.
+
+    Integer columns of four-digit years are used as they are. Otherwise each
+    distinct value is parsed only once, since year columns typically repeat a
+    handful of values over many rows.
+
+    Args:
+        series (pd.Series): The column to convert.
+        year_format (str): The format of the values, as accepted by `pd.to_datetime`.
+
+    Returns:
+        pd.Series: The year of each value (float if there are missing values).
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.year
+
+    # Integer columns holding four-digit years already are the years
+    if (
+        pd.api.types.is_integer_dtype(series)
+        and year_format in ("%Y", "ISO8601")
+        and not series.isna().any()
+        and (series.empty or (series.min() >= 1000 and series.max() <= 9999))
+    ):
+        return series.astype("int32")
+
+    codes, uniques = pd.factorize(series)
+    years = pd.to_datetime(pd.Series(uniques), format=year_format).dt.year.to_numpy()
+
+    # Missing values get code -1, which picks the NaN appended at the end
+    if (codes == -1).any():
+        years = np.append(years.astype("float64"), np.nan)
+
+    return pd.Series(years[codes], index=series.index, name=series.name)
+
+
 def create_pydeflate_year(
     data: pd.DataFrame, year_column: str, year_format: str | None = None
 ) -> pd.DataFrame:
     if year_format is None:
         year_format = "ISO8601"
 
-    data = data.copy()
-
-    data["pydeflate_year"] = pd.to_datetime(
-        data[year_column], format=year_format
-    ).dt.year
-
-    return data
+    # Return a new frame with the year column added, leaving the input untouched
+    return data.assign(pydeflate_year=to_year(data[year_column], year_format))
+
+
+def build_lookup(
+    pydeflate_data: pd.DataFrame, ix: list[str]
+) -> tuple[pd.Index, pd.Index, pd.Index]:
+    """Index the year and entity keys of pydeflate data, for repeated lookups.
+
+    Years and entities are encoded as positions in their distinct values, and
+    combined into a single integer key per row.
+
+    Args:
+        pydeflate_data (pd.DataFrame): The pydeflate data, without missing keys.
+        ix (list[str]): The year and entity key columns.
+
+    Returns:
+        tuple[pd.Index, pd.Index, pd.Index]: The distinct years, the distinct
+        entities, and the combined key of each row.
+    """
+    years = pd.Index(pydeflate_data[ix[0]].unique())
+    entities = pd.Index(pydeflate_data[ix[1]].unique())
+
+    keys = years.get_indexer(pydeflate_data[ix[0]]).astype("int64") * len(
+        entities
+    ) + entities.get_indexer(pydeflate_data[ix[1]])
+
+    return years, entities, pd.Index(keys)
+
+
+def encode_keys(
+    years: pd.Series,
+    entities: pd.Series,
+    lookup: tuple[pd.Index, pd.Index, pd.Index],
+) -> np.ndarray:
+    """Encode year and entity pairs like the keys of a `build_lookup` result.
+
+    Pairs whose year or entity is not in the lookup get -1, so they never match.
+    Numeric keys cannot be matched against text keys (or the other way round);
+    like `pd.merge`, this raises a ValueError instead of matching nothing.
+    """
+    lookup_years, lookup_entities, _ = lookup
+
+    for user, pydeflate in ((years, lookup_years), (entities, lookup_entities)):
+        if pd.api.types.is_numeric_dtype(user) != pd.api.types.is_numeric_dtype(
+            pydeflate
+        ):
+            raise ValueError(
+                f"You are trying to merge on {user.dtype} and {pydeflate.dtype} "
+                f"columns for key '{user.name}'."
+            )
+
+    year_codes = lookup_years.get_indexer(years)
+    entity_codes = lookup_entities.get_indexer(entities)
+
+    return np.where(
+        (year_codes == -1) | (entity_codes == -1),
+        -1,
+        year_codes.astype("int64") * len(lookup_entities) + entity_codes,
+    )
 
 
 def merge_user_and_pydeflate_data(
@@ -56,33 +166,71 @@ def merge_user_and_pydeflate_data(
     pydeflate_data: pd.DataFrame,
     entity_column: str,
     ix: list[str],
+    lookup: tuple[pd.Index, pd.Index, pd.Index] | None = None,
 ) -> pd.DataFrame:
-    return data.merge(
-        pydeflate_data,
-        how="outer",
-        left_on=["pydeflate_year", entity_column],
-        right_on=ix,
-        suffixes=("", "_pydeflate"),
-        indicator=True,
-    ).pipe(enforce_pyarrow_types)
+    """Add the pydeflate columns to each row of the user data, matching on year
+    and entity. Rows are kept in their original order; whether each row found a
+    match is recorded in the `pydeflate_matched` column.
+
+    `lookup` is the result of `build_lookup` for `pydeflate_data`, if already
+    available. Missing years or entities never match.
+    """
+    lookup = lookup or build_lookup(pydeflate_data, ix)
+    keys = lookup[2]
+
+    # Encode the user keys against the pydeflate ones
+    user_keys = encode_keys(data["pydeflate_year"], data[entity_column], lookup)
+
+    # Columns already in the user data keep their name there, like merge suffixes
+    pydeflate_data = pydeflate_data.drop(columns=ix[0]).rename(
+        columns=lambda c: f"{c}_pydeflate" if c in data.columns else c
+    )
+
+    # With unique keys, each row matches at most one pydeflate row: look it up
+    if keys.is_unique:
+        position = keys.get_indexer(user_keys)
+        matched = {
+            c: pydeflate_data[c].array.take(position, allow_fill=True)
+            for c in pydeflate_data.columns
+        }
+        merged = data.reset_index(drop=True).assign(
+            **matched, pydeflate_matched=position != -1
+        )
+
+    # Otherwise rows are repeated for every match, as a left merge would. The
+    # match flag is set before merging, so no merge indicator is needed.
+    else:
+        merged = (
+            data.assign(
+                pydeflate_key=user_keys,
+                pydeflate_matched=np.isin(user_keys, keys),
+            )
+            .merge(
+                pydeflate_data.assign(pydeflate_key=keys),
+                how="left",
+                on="pydeflate_key",
+            )
+            .drop(columns="pydeflate_key")
+        )
+
+    return merged.pipe(enforce_pyarrow_types)
 
 
 def get_unmatched_pydeflate_data(
     merged_data: pd.DataFrame,
 ):
-    return merged_data.loc[merged_data["_merge"] == "left_only"].filter(
-        regex="^(?!pydeflate_)(?!.*_pydeflate$)"
-    )
+    # Only the user's own columns (no pydeflate or suffixed pydeflate columns)
+    columns = [
+        not str(c).startswith("pydeflate_") and not str(c).endswith("_pydeflate")
+        for c in merged_data.columns
+    ]
+    return merged_data.loc[~merged_data["pydeflate_matched"], columns]
 
 
 def get_matched_pydeflate_data(
     merged_data: pd.DataFrame,
 ):
-    return (
-        merged_data.loc[merged_data["_merge"] != "right_only"]
-        .drop(columns="_merge")
-        .reset_index(drop=True)
-    )
+    return merged_data.drop(columns="pydeflate_matched").reset_index(drop=True)
 
 
 def flag_missing_pydeflate_data(
@@ -0,0 +1,159 @@
+import os
+
+import pandas as pd
+
+from pydeflate.core import exchange as exchange_module
+from pydeflate.core import source as source_module
+from pydeflate.core.api import BaseDeflate, BaseExchange
+from pydeflate.core.exchange import Exchange
+from pydeflate.core.source import Source
+from pydeflate.pydeflate_config import PYDEFLATE_PATHS
+from pydeflate.utils import store_in_cache
+
+
+def make_data(deflator_2020: float) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "pydeflate_year": [2020, 2021],
+            "pydeflate_entity_code": ["USA", "USA"],
+            "pydeflate_iso3": ["USA", "USA"],
+            "pydeflate_EXCHANGE": [1.0, 1.0],
+            "pydeflate_NGDP_D": [deflator_2020, 100.0],
+        }
+    )
+
+
+def make_reader(old: float, fresh: float):
+    """A reader that returns `old` deflators, or `fresh` ones when updating."""
+
+    def reader(update: bool = False) -> pd.DataFrame:
+        return make_data(fresh if update else old)
+
+    return reader
+
+
+def deflate(source: Source) -> float:
+    deflator = BaseDeflate(
+        deflator_source=source,
+        exchange_source=source,
+        base_year=2021,
+        price_kind="NGDP_D",
+        source_currency="USA",
+        target_currency="USA",
+    )
+    data = pd.DataFrame({"iso_code": ["USA"], "year": [2020], "value": [100.0]})
+    result = deflator.deflate(
+        data=data, entity_column="iso_code", year_column="year", value_column="value"
+    )
+    return result["value"].iloc[0]
+
+
+def test_refresh_through_exchange_reaches_deflate():
+    reader = make_reader(old=90.0, fresh=80.0)
+
+    assert deflate(Source(name="Test", reader=reader)) == 111.111111
+
+    # Refresh the data through an exchange, then deflate without updating
+    BaseExchange(
+        exchange_source=Source(name="Test", reader=reader, update=True),
+        source_currency="USA",
+        target_currency="USA",
+    )
+
+    assert deflate(Source(name="Test", reader=reader)) == 125.0
+
+
+def test_refresh_through_deflate_reaches_deflate():
+    reader = make_reader(old=90.0, fresh=80.0)
+
+    assert deflate(Source(name="Test", reader=reader)) == 111.111111
+    assert deflate(Source(name="Test", reader=reader, update=True)) == 125.0
+    assert deflate(Source(name="Test", reader=reader)) == 125.0
+
+
+def test_sources_with_the_same_name_and_different_readers():
+    first = Source(name="Shared", reader=make_reader(old=90.0, fresh=90.0))
+    second = Source(name="Shared", reader=make_reader(old=80.0, fresh=80.0))
+
+    assert deflate(first) == 111.111111
+    assert deflate(second) == 125.0
+
+
+def test_store_in_cache_evicts_oldest_first():
+    cache = {}
+    for key in "abcd":
+        store_in_cache(cache, key, key.upper(), max_size=3)
+
+    assert list(cache) == ["b", "c", "d"]
+
+    # Storing an existing key refreshes it instead of evicting another entry
+    store_in_cache(cache, "b", "B2", max_size=3)
+    assert cache == {"c": "C", "d": "D", "b": "B2"}
+
+
+def test_exchange_cache_evicts_at_its_size(monkeypatch):
+    monkeypatch.setattr(exchange_module, "_EXCHANGE_DATA_CACHE", {})
+    monkeypatch.setattr(exchange_module, "_EXCHANGE_DATA_CACHE_SIZE", 2)
+
+    sources = [
+        Source(name=f"Exchange {i}", reader=make_reader(old=90.0, fresh=90.0))
+        for i in range(3)
+    ]
+    for source in sources:
+        Exchange(source=source, source_currency="LCU", target_currency="USA")
+
+    cached = [key[0] for key in exchange_module._EXCHANGE_DATA_CACHE]
+    assert cached == [sources[1].data_key, sources[2].data_key]
+
+
+def counting_reader(reads: list):
+    """A reader that records each time it is called."""
+
+    def reader(update: bool = False) -> pd.DataFrame:
+        reads.append(update)
+        return make_data(90.0)
+
+    return reader
+
+
+def test_source_rereads_files_changed_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(PYDEFLATE_PATHS, "data", tmp_path)
+    reads = []
+    reader = counting_reader(reads)
+    file = tmp_path / "test_2024-01-01.parquet"
+    file.touch()
+
+    first = Source(name="Files", reader=reader)
+    assert Source(name="Files", reader=reader).data_key == first.data_key
+
+    # Another process updates the file
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    second = Source(name="Files", reader=reader)
+
+    assert len(reads) == 2
+    assert second.data_key != first.data_key
+
+
+def test_sources_do_not_share_mutable_data():
+    reader = make_reader(old=90.0, fresh=90.0)
+    first = Source(name="Mutable", reader=reader)
+
+    first.data.loc[0, "pydeflate_NGDP_D"] = 0.0
+    exchange = first.lcu_usd_exchange()
+    exchange.loc[0, "pydeflate_EXCHANGE"] = 0.0
+    second = Source(name="Mutable", reader=reader)
+
+    assert second.data["pydeflate_NGDP_D"].tolist() == [90.0, 100.0]
+    assert second.lcu_usd_exchange()["pydeflate_EXCHANGE"].tolist() == [1.0, 1.0]
+
+
+def test_source_cache_evicts_at_its_size(monkeypatch):
+    monkeypatch.setattr(source_module, "_SOURCE_DATA_CACHE", {})
+    monkeypatch.setattr(source_module, "_SOURCE_DATA_CACHE_SIZE", 2)
+
+    for name in ["First", "Second", "Third"]:
+        Source(name=name, reader=make_reader(old=90.0, fresh=90.0))
+
+    cached = [key[1] for key in source_module._SOURCE_DATA_CACHE]
+    assert cached == ["Second", "Third"]
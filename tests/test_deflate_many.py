@@ -0,0 +1,112 @@
+import pandas as pd
+import pytest
+
+from pydeflate.core.api import BaseDeflate
+from pydeflate.core.source import Source
+
+
+def read_data(update: bool = False) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "pydeflate_year": [2020, 2021, 2020, 2021],
+            "pydeflate_entity_code": ["USA", "USA", "FRA", "FRA"],
+            "pydeflate_iso3": ["USA", "USA", "FRA", "FRA"],
+            "pydeflate_EXCHANGE": [1.0, 1.0, 0.9, 0.8],
+            "pydeflate_NGDP_D": [90.0, 100.0, 95.0, 100.0],
+        }
+    )
+
+
+def get_deflator() -> BaseDeflate:
+    return BaseDeflate(
+        deflator_source=Source(name="Test", reader=read_data),
+        exchange_source=Source(name="Test", reader=read_data),
+        base_year=2021,
+        price_kind="NGDP_D",
+        source_currency="USA",
+        target_currency="USA",
+    )
+
+
+# GBR has no deflator data
+data = pd.DataFrame(
+    {
+        "iso_code": ["USA", "FRA", "GBR", "FRA"],
+        "year": [2020, 2020, 2020, 2021],
+        "a": [100.0, 200.0, 300.0, 400.0],
+        "b": [1.0, 2.0, 3.0, 4.0],
+    }
+)
+
+columns = dict(entity_column="iso_code", year_column="year")
+
+
+def test_deflate_many_matches_repeated_deflate():
+    deflator = get_deflator()
+
+    expected = deflator.deflate(
+        data=data, value_column="a", target_value_column="a_c", **columns
+    )
+    expected = deflator.deflate(
+        data=expected, value_column="b", target_value_column="b_c", **columns
+    )
+
+    result = deflator.deflate_many(
+        data=data,
+        value_columns=["a", "b"],
+        target_value_columns=["a_c", "b_c"],
+        **columns,
+    )
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_deflate_many_in_place():
+    deflator = get_deflator()
+
+    expected = deflator.deflate(data=data, value_column="a", **columns)
+    expected = deflator.deflate(data=expected, value_column="b", **columns)
+
+    # No targets, and empty target names, both deflate the value columns in place
+    for targets in [None, ["", ""]]:
+        result = deflator.deflate_many(
+            data=data,
+            value_columns=["a", "b"],
+            target_value_columns=targets,
+            **columns,
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+
+def test_deflate_treats_empty_target_as_value_column():
+    deflator = get_deflator()
+
+    pd.testing.assert_frame_equal(
+        deflator.deflate(
+            data=data, value_column="a", target_value_column="", **columns
+        ),
+        deflator.deflate(data=data, value_column="a", **columns),
+    )
+
+
+def test_deflate_many_missing_column():
+    deflator = get_deflator()
+
+    with pytest.raises(KeyError):
+        deflator.deflate(data=data, value_column="missing", **columns)
+
+    with pytest.raises(KeyError):
+        deflator.deflate_many(data=data, value_columns=["a", "missing"], **columns)
+
+
+def test_deflate_many_empty_list():
+    result = get_deflator().deflate_many(data=data, value_columns=[], **columns)
+
+    pd.testing.assert_frame_equal(result, data)
+
+
+def test_deflate_many_mismatched_targets():
+    with pytest.raises(ValueError):
+        get_deflator().deflate_many(
+            data=data, value_columns=["a", "b"], target_value_columns=["a_c"], **columns
+        )
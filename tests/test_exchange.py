@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+from pydeflate.core.exchange import Exchange
+from pydeflate.core.source import Source
+
+
+def read_exchange(update: bool = False) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "pydeflate_year": [2020, 2021, 2020, 2021],
+            "pydeflate_entity_code": ["302", "302", "4", "4"],
+            "pydeflate_iso3": ["USA", "USA", "FRA", "FRA"],
+            "pydeflate_EXCHANGE": [1.0, 1.0, 0.8, 0.9],
+        }
+    )
+
+
+def user_data() -> pd.DataFrame:
+    # GBR has no exchange data, and FRA has none for 2019
+    return pd.DataFrame(
+        {
+            "iso_code": ["FRA", "GBR", "USA", "FRA"],
+            "year": [2021, 2021, 2020, 2019],
+            "value": [9, 5, 3, 1],
+        }
+    )
+
+
+def make_exchange(source_currency: str, target_currency: str) -> Exchange:
+    return Exchange(
+        source=Source(name="Exchange test", reader=read_exchange),
+        source_currency=source_currency,
+        target_currency=target_currency,
+    )
+
+
+def test_same_currency_marks_unmatched_rows():
+    result = make_exchange("USA", "USA").exchange(
+        user_data(), value_column="value", entity_column="iso_code", year_column="year"
+    )
+
+    values = result["value"].to_numpy(dtype="float64", na_value=np.nan)
+    assert values[0] == 9.0 and values[2] == 3.0
+    assert np.isnan(values[1]) and np.isnan(values[3])
+    assert list(result.columns) == ["iso_code", "year", "value"]
+
+
+def test_same_currency_merge_deflator_keeps_rows():
+    data = user_data()
+
+    result = make_exchange("USA", "USA").merge_deflator(
+        data, entity_column="iso_code", year_column="year"
+    )
+
+    assert list(result.columns) == ["iso_code", "year", "value"]
+    assert result["iso_code"].tolist() == data["iso_code"].tolist()
+
+
+def merge_reference(
+    exchange: Exchange, data: pd.DataFrame, entity_column: str, use_source_codes: bool
+) -> pd.DataFrame:
+    """Convert `data` by left-merging the exchange data, as Exchange used to."""
+    data = data.assign(pydeflate_year=pd.to_datetime(data["year"], format="%Y").dt.year)
+    merged = data.merge(
+        exchange.exchange_data.filter(
+            ["pydeflate_year", "pydeflate_entity_code", "pydeflate_iso3"]
+            + ["pydeflate_EXCHANGE", "pydeflate_EXCHANGE_D"]
+        ),
+        how="left",
+        left_on=["pydeflate_year", entity_column],
+        right_on=[
+            "pydeflate_year",
+            "pydeflate_entity_code" if use_source_codes else "pydeflate_iso3",
+        ],
+    )
+    return merged.assign(value=merged["value"] / merged["pydeflate_EXCHANGE"])
+
+
+def assert_matches_reference(data, entity_column, use_source_codes=False):
+    exchange = make_exchange("LCU", "USA")
+    expected = merge_reference(exchange, data, entity_column, use_source_codes)
+
+    result = exchange.exchange(
+        data,
+        value_column="value",
+        entity_column=entity_column,
+        year_column="year",
+        use_source_codes=use_source_codes,
+    )
+    deflator = exchange.merge_deflator(
+        data,
+        entity_column=entity_column,
+        year_column="year",
+        use_source_codes=use_source_codes,
+    )
+
+    np.testing.assert_allclose(
+        result["value"].to_numpy(dtype="float64", na_value=np.nan),
+        expected["value"].to_numpy(dtype="float64", na_value=np.nan),
+    )
+    assert deflator[entity_column].tolist() == expected[entity_column].tolist()
+    assert deflator["year"].tolist() == expected["year"].tolist()
+
+    return result
+
+
+def test_exchange_matches_merge_with_unmatched_keys():
+    result = assert_matches_reference(user_data(), entity_column="iso_code")
+
+    assert result["value"].isna().tolist() == [False, True, False, True]
+
+
+def test_exchange_matches_merge_with_source_codes():
+    data = user_data().assign(code=["4", "999", "302", "4"])
+
+    result = assert_matches_reference(data, entity_column="code", use_source_codes=True)
+
+    assert result["value"].isna().tolist() == [False, True, False, True]
+
+
+def test_exchange_matches_merge_with_mixed_entity_keys():
+    # Numeric codes never match the text codes of the exchange data
+    data = user_data().assign(code=pd.Series(["4", 4, "302", 302], dtype=object))
+
+    result = assert_matches_reference(data, entity_column="code", use_source_codes=True)
+
+    assert result["value"].isna().tolist() == [False, True, False, True]
+
+
+def read_duplicated_target(update: bool = False) -> pd.DataFrame:
+    # Two entities map to FRA. Entity 5 comes first in the file, but entity 4
+    # has the lower code, so its rate is used when it has one.
+    return pd.DataFrame(
+        {
+            "pydeflate_year": [2020, 2021, 2020, 2021, 2020, 2021],
+            "pydeflate_entity_code": ["302", "302", "5", "5", "4", "4"],
+            "pydeflate_iso3": ["USA", "USA", "FRA", "FRA", "FRA", "FRA"],
+            "pydeflate_EXCHANGE": [1.0, 1.0, 0.5, 0.6, 0.8, np.nan],
+        }
+    )
+
+
+def test_target_currency_with_several_entities():
+    exchange = Exchange(
+        source=Source(name="Duplicated target", reader=read_duplicated_target),
+        source_currency="LCU",
+        target_currency="FRA",
+    )
+
+    usa = exchange.exchange_data.query("pydeflate_entity_code == '302'")
+
+    # One row per year and entity, using entity 4 and then entity 5 for 2021
+    assert len(exchange.exchange_data) == 6
+    np.testing.assert_allclose(usa["pydeflate_EXCHANGE"], [0.8, 0.6])
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from pydeflate.sources.common import compute_exchange_deflator
+
+
+def make_data():
+    # A has a base year (2021) through NGDPD_D, B never reaches 100 and C has
+    # no entity code. Groups are interleaved to check the row order.
+    return pd.DataFrame(
+        {
+            "entity": ["A", "B", "A", "C", "B", "A"],
+            "entity_code": [1, 2, 1, None, 2, 1],
+            "year": [2020, 2020, 2021, 2021, 2021, 2022],
+            "NGDPD_D": [90.0, 80.0, 100.0, 100.0, 90.0, 110.0],
+            "EXCHANGE": [1.0, 1.0, 2.0, 3.0, 2.0, np.nan],
+        }
+    )
+
+
+def test_base_year_from_measure():
+    result = compute_exchange_deflator(make_data(), base_year_measure="NGDPD_D")
+
+    # Rows keep the input order and index, without the row missing a group key
+    assert result.index.tolist() == [0, 1, 2, 4, 5]
+    assert result["entity"].tolist() == ["A", "B", "A", "B", "A"]
+    assert result["year"].tolist() == [2020, 2020, 2021, 2021, 2022]
+
+    # B has no base year, so it gets no deflator
+    deflator = result["EXCHANGE_D"].tolist()
+    assert deflator[0] == 50.0
+    assert deflator[2] == 100.0
+    assert np.isnan(deflator[4])
+    assert np.isnan(deflator[1]) and np.isnan(deflator[3])
+
+
+def test_base_year_falls_back_to_latest_exchange():
+    result = compute_exchange_deflator(make_data())
+
+    # The latest year with an exchange rate is 2021 for both A and B
+    deflator = result["EXCHANGE_D"].tolist()
+    assert deflator[:4] == [50.0, 50.0, 100.0, 100.0]
+    assert np.isnan(deflator[4])
+
+
+def test_group_without_base_value():
+    data = make_data()
+    data.loc[data["entity"] == "A", "NGDPD_D"] = [90.0, 95.0, 100.0]
+
+    # A's base year (2022) has no exchange rate, and B has no base year
+    result = compute_exchange_deflator(data, base_year_measure="NGDPD_D")
+
+    assert "EXCHANGE_D" not in result.columns
+    assert result["entity"].tolist() == ["A", "B", "A", "B", "A"]
+
+
+def test_existing_deflator_kept_without_base_value():
+    data = make_data().assign(EXCHANGE_D=7.0)
+
+    result = compute_exchange_deflator(data, base_year_measure="NGDPD_D")
+
+    assert result["EXCHANGE_D"].tolist()[:4] == [50.0, 7.0, 100.0, 7.0]
+
+
+def test_exchange_name_suffix_is_dropped():
+    data = make_data().rename(columns={"EXCHANGE": "EXCHANGE_to"})
+
+    result = compute_exchange_deflator(
+        data, base_year_measure="NGDPD_D", exchange="EXCHANGE_to"
+    )
+
+    assert result["EXCHANGE_D"].tolist()[0] == 50.0
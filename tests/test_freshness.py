@@ -0,0 +1,95 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from pydeflate.pydeflate_config import PYDEFLATE_PATHS
+from pydeflate.sources import common
+
+OLD_FILE = "weo_2000-01-01.parquet"
+
+
+@pytest.fixture
+def warnings(tmp_path, monkeypatch):
+    """Use an empty data folder and collect the logged warnings."""
+    monkeypatch.setattr(PYDEFLATE_PATHS, "data", tmp_path)
+    monkeypatch.setattr(common, "_FRESHNESS_CHECKED", set())
+    monkeypatch.delenv("PYDEFLATE_SKIP_FRESHNESS", raising=False)
+
+    logged = []
+    monkeypatch.setattr(common.logger, "warning", logged.append)
+    return logged
+
+
+def new_process(monkeypatch):
+    """Forget the checks made in this process, as a new process would."""
+    monkeypatch.setattr(common, "_FRESHNESS_CHECKED", set())
+
+
+def test_warns_once_within_ttl(warnings, tmp_path, monkeypatch):
+    file = tmp_path / OLD_FILE
+
+    common.warn_if_stale(file, "WEO")
+    common.warn_if_stale(file, "WEO")
+    new_process(monkeypatch)
+    common.warn_if_stale(file, "WEO")
+
+    assert len(warnings) == 1
+    assert OLD_FILE in json.loads((tmp_path / ".freshness.json").read_text())
+
+
+def test_warns_again_after_ttl(warnings, tmp_path, monkeypatch):
+    file = tmp_path / OLD_FILE
+    common.warn_if_stale(file, "WEO")
+
+    cache_file = tmp_path / ".freshness.json"
+    cache = json.loads(cache_file.read_text())
+    checked_at = datetime.now() - timedelta(minutes=common.FRESHNESS_TTL_MINUTES + 1)
+    cache[OLD_FILE]["checked_at"] = checked_at.isoformat()
+    cache_file.write_text(json.dumps(cache))
+
+    new_process(monkeypatch)
+    common.warn_if_stale(file, "WEO")
+
+    assert len(warnings) == 2
+
+
+def test_invalidate_freshness_checks_again(warnings, tmp_path):
+    file = tmp_path / OLD_FILE
+    common.warn_if_stale(file, "WEO")
+
+    common.invalidate_freshness([file])
+    common.warn_if_stale(file, "WEO")
+
+    assert len(warnings) == 2
+    assert OLD_FILE in json.loads((tmp_path / ".freshness.json").read_text())
+
+
+def test_skipped_with_env_var(warnings, tmp_path, monkeypatch):
+    monkeypatch.setenv("PYDEFLATE_SKIP_FRESHNESS", "1")
+
+    common.warn_if_stale(tmp_path / OLD_FILE, "WEO")
+
+    assert warnings == []
+    assert not (tmp_path / ".freshness.json").exists()
+
+
+def test_fresh_file_does_not_warn(warnings, tmp_path):
+    today = datetime.today().strftime("%Y-%m-%d")
+
+    common.warn_if_stale(tmp_path / f"weo_{today}.parquet", "WEO")
+
+    assert warnings == []
+
+
+def test_unwritable_folder(warnings, tmp_path, monkeypatch):
+    # A folder that does not exist cannot be written to, even by root
+    monkeypatch.setattr(PYDEFLATE_PATHS, "data", tmp_path / "missing")
+    file = tmp_path / OLD_FILE
+
+    common.warn_if_stale(file, "WEO")
+    new_process(monkeypatch)
+    common.warn_if_stale(file, "WEO")
+
+    # Nothing is recorded, so every process checks again
+    assert len(warnings) == 2
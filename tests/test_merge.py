@@ -0,0 +1,123 @@
+import pandas as pd
+import pytest
+
+from pydeflate.utils import build_lookup, encode_keys, merge_user_and_pydeflate_data
+
+IX = ["pydeflate_year", "pydeflate_iso3"]
+
+
+def pydeflate_data():
+    return pd.DataFrame(
+        {
+            "pydeflate_year": [2020, 2020, 2021, 2021],
+            "pydeflate_iso3": ["USA", "FRA", "USA", "FRA"],
+            "pydeflate_NGDP_D": [90.0, 95.0, 100.0, 100.0],
+        }
+    )
+
+
+def user_data():
+    return pd.DataFrame(
+        {
+            "iso_code": ["FRA", "GBR", "USA", "USA", "FRA"],
+            "pydeflate_year": [2021, 2021, None, 2020, 2020],
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+        },
+        index=[9, 8, 7, 6, 5],
+    )
+
+
+def test_encode_keys_unmatched_and_missing_years():
+    lookup = build_lookup(pydeflate_data(), IX)
+    data = user_data()
+
+    codes = encode_keys(data["pydeflate_year"], data["iso_code"], lookup)
+
+    # GBR is not in the data and the third row has no year
+    assert codes[1] == -1
+    assert codes[2] == -1
+    assert list(lookup[2].get_indexer(codes)) == [3, -1, -1, 0, 1]
+
+
+def test_merge_keeps_order_and_flags_matches():
+    merged = merge_user_and_pydeflate_data(
+        user_data(), pydeflate_data(), entity_column="iso_code", ix=IX
+    )
+
+    assert merged["value"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert merged["pydeflate_matched"].tolist() == [True, False, False, True, True]
+    assert merged["pydeflate_NGDP_D"].tolist()[0] == 100.0
+    assert merged["pydeflate_NGDP_D"].isna().tolist() == [
+        False,
+        True,
+        True,
+        False,
+        False,
+    ]
+    assert merged["pydeflate_NGDP_D"].tolist()[3:] == [90.0, 95.0]
+
+
+def test_merge_with_prebuilt_lookup_matches_default():
+    data = pydeflate_data()
+    lookup = build_lookup(data, IX)
+
+    expected = merge_user_and_pydeflate_data(user_data(), data, "iso_code", IX)
+    result = merge_user_and_pydeflate_data(
+        user_data(), data, "iso_code", IX, lookup=lookup
+    )
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_merge_duplicate_keys_repeats_rows():
+    data = pd.concat(
+        [
+            pydeflate_data(),
+            pd.DataFrame(
+                {
+                    "pydeflate_year": [2020],
+                    "pydeflate_iso3": ["FRA"],
+                    "pydeflate_NGDP_D": [96.0],
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+
+    merged = merge_user_and_pydeflate_data(user_data(), data, "iso_code", IX)
+
+    # The FRA 2020 row matches twice, like a left merge; the rest match once
+    assert merged["value"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 5.0]
+    assert merged["pydeflate_matched"].tolist() == [
+        True,
+        False,
+        False,
+        True,
+        True,
+        True,
+    ]
+    assert sorted(merged["pydeflate_NGDP_D"].tolist()[4:]) == [95.0, 96.0]
+
+
+def test_merge_suffixes_existing_columns():
+    data = user_data().assign(pydeflate_NGDP_D=0.0)
+
+    merged = merge_user_and_pydeflate_data(data, pydeflate_data(), "iso_code", IX)
+
+    assert merged["pydeflate_NGDP_D"].tolist() == [0.0] * 5
+    assert merged["pydeflate_NGDP_D_pydeflate"].tolist()[3:] == [90.0, 95.0]
+
+
+def test_merge_mismatched_key_dtypes_raises():
+    data = user_data().assign(iso_code=[1, 2, 3, 4, 5])
+
+    with pytest.raises(ValueError, match="iso_code"):
+        merge_user_and_pydeflate_data(data, pydeflate_data(), "iso_code", IX)
+
+    lookup = build_lookup(pydeflate_data(), IX)
+    with pytest.raises(ValueError, match="pydeflate_year"):
+        encode_keys(
+            pd.Series(["2020"], name="pydeflate_year"),
+            pd.Series(["USA"]),
+            lookup,
+        )
@@ -0,0 +1,58 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import pydeflate
+
+
+def test_deflate_is_the_legacy_function():
+    # Resolving other names imports the `pydeflate.deflate` subpackage, which
+    # must not hide the function
+    assert callable(pydeflate.oecd_dac_deflate)
+    assert callable(pydeflate.deflate)
+    assert pydeflate.deflate.__module__ == "pydeflate.deflate.legacy_deflate"
+
+
+def test_deflate_resolves_after_importing_the_subpackage():
+    importlib.import_module("pydeflate.deflate.deflators")
+
+    # Any lazy lookup unbinds the subpackage from the `deflate` name
+    assert callable(pydeflate.wb_exchange)
+    assert pydeflate.deflate.__module__ == "pydeflate.deflate.legacy_deflate"
+
+
+def test_dir_lists_public_names_and_attributes():
+    names = dir(pydeflate)
+
+    assert set(pydeflate.__all__) <= set(names)
+    assert "__version__" in names and "__author__" in names
+    assert names == sorted(names)
+
+
+def test_public_names_resolve():
+    for name in pydeflate.__all__:
+        assert callable(getattr(pydeflate, name))
+
+
+def _modules_after_import(**env) -> set[str]:
+    """The pydeflate modules loaded by `import pydeflate` in a new process."""
+    code = "import sys, pydeflate; print(*sorted(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={k: v for k, v in os.environ.items() if k != "EAGER_IMPORT"} | env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {m for m in result.stdout.split() if m.startswith("pydeflate")}
+
+
+def test_import_is_lazy():
+    assert "pydeflate.deflate.deflators" not in _modules_after_import()
+
+
+def test_eager_import_loads_every_public_name():
+    modules = _modules_after_import(EAGER_IMPORT="1")
+
+    assert {module for module, _ in pydeflate._LAZY.values()} <= modules
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from pydeflate.utils import create_pydeflate_year, to_year
+
+CASES = {
+    "int": (pd.Series([2020, 2021, 2020]), "ISO8601", [2020, 2021, 2020]),
+    "int_year_format": (pd.Series([2020, 2021]), "%Y", [2020, 2021]),
+    "int64_with_na": (
+        pd.Series([2020, None, 2021], dtype="Int64"),
+        "ISO8601",
+        [2020, None, 2021],
+    ),
+    "string": (pd.Series(["2020", "2021", "2020"]), "%Y", [2020, 2021, 2020]),
+    "string_with_none": (pd.Series(["2020", None]), "%Y", [2020, None]),
+    "iso": (pd.Series(["2020-01-01", "2021-06-30"]), "ISO8601", [2020, 2021]),
+    "datetime": (
+        pd.Series(pd.to_datetime(["2020-01-01", "2021-06-30"])),
+        "ISO8601",
+        [2020, 2021],
+    ),
+    "nat": (
+        pd.Series(pd.to_datetime(["2020-01-01", None])),
+        "ISO8601",
+        [2020, None],
+    ),
+    "year_month": (pd.Series(["202001", "202112"]), "%Y%m", [2020, 2021]),
+}
+
+
+@pytest.mark.parametrize("series, year_format, expected", CASES.values(), ids=CASES)
+def test_to_year_matches_to_datetime(series, year_format, expected):
+    result = to_year(series, year_format)
+    reference = pd.to_datetime(series, format=year_format).dt.year
+
+    pd.testing.assert_series_equal(result, reference)
+    assert result.isna().tolist() == [value is None for value in expected]
+    assert result.dropna().tolist() == [v for v in expected if v is not None]
+
+
+def test_to_year_keeps_index_and_name():
+    series = pd.Series(["2021", "2020", "2021"], index=[10, 5, 7], name="year")
+
+    result = to_year(series, "%Y")
+
+    assert result.index.tolist() == [10, 5, 7]
+    assert result.name == "year"
+    assert result.tolist() == [2021, 2020, 2021]
+
+
+def test_to_year_integer_fast_path_keeps_index():
+    series = pd.Series([2021, 2020], index=["b", "a"], name="year")
+
+    result = to_year(series, "%Y")
+
+    assert result.index.tolist() == ["b", "a"]
+    assert result.tolist() == [2021, 2020]
+
+
+def test_create_pydeflate_year_adds_column():
+    data = pd.DataFrame({"date": ["2020-03-01", "2021-12-31"]}, index=[3, 1])
+
+    result = create_pydeflate_year(data, year_column="date")
+
+    assert result["pydeflate_year"].tolist() == [2020, 2021]
+    assert result.index.tolist() == [3, 1]